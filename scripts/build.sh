@@ -10,7 +10,8 @@ echo "----------------------------------"
 for file in $files
 do
     newfile=$(echo $file | sed "s+src/+bin/+" | sed "s+.py+.mpy+")
-    build_result=$(python3 -m mpy_cross $file -o $newfile 2>&1)
+    # armv6m native code also runs on the armv7m/armv8m cores of newer boards.
+    build_result=$(python3 -m mpy_cross -march=armv6m $file -o $newfile 2>&1)
     if [[ -n $build_result ]]
     then
         echo -e "🔨 ${RED}$newfile ❌"
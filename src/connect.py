@@ -56,12 +56,12 @@ class ScanResult(object):
     @property
     def json(self) -> dict[str, str]:
         return {
-            const("SSID"): self.ssid,
-            const("BSSID"): self.bssid,
-            const("CHANNEL"): self.channel,
-            const("RSSI"): self.RSSI,
-            const("SECURITY"): self.security,
-            const("HIDDEN"): self.hidden,
+            "SSID": self.ssid,
+            "BSSID": self.bssid,
+            "CHANNEL": self.channel,
+            "RSSI": self.RSSI,
+            "SECURITY": self.security,
+            "HIDDEN": self.hidden,
         }
 
 
@@ -96,12 +96,12 @@ class NetworkInfo(object):
     @property
     def json(self) -> dict[str, str]:
         return {
-            const("HOSTNAME"): self.hostname,
-            const("IP"): self.ip,
-            const("MAC"): self.mac,
-            const("CONNECTED"): str(self.connected),
-            const("STATUS"): str(self.status),
-            const("VERSION"): self.version,
+            "HOSTNAME": self.hostname,
+            "IP": self.ip,
+            "MAC": self.mac,
+            "CONNECTED": str(self.connected),
+            "STATUS": str(self.status),
+            "VERSION": self.version,
         }
 
     def __repr__(self) -> str:
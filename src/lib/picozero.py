@@ -38,7 +38,7 @@ class PinMixin:
         return self._pin_num
 
     def __str__(self):
-        return "{} (pin {})".format(self.__class__.__name__, self._pin_num)
+        return f"{self.__class__.__name__} (pin {self._pin_num})"
 
 
 class PinsMixin:
@@ -56,7 +56,7 @@ class PinsMixin:
         return self._pin_nums
 
     def __str__(self):
-        return "{} (pins - {})".format(self.__class__.__name__, self._pin_nums)
+        return f"{self.__class__.__name__} (pins - {self._pin_nums})"
 
 
 class ValueChange:
@@ -303,9 +303,13 @@ class DigitalOutputDevice(OutputDevice, PinMixin):
         :data:`True`, the LED will be switched on initially.
     """
 
+    # Slowest square wave a PWM slice can generate (125MHz / 256 / 65536).
+    PWM_MIN_FREQ = 8
+
     def __init__(self, pin, active_high=True, initial_value=False):
         self._pin_num = pin
         self._pin = Pin(pin, Pin.OUT)
+        self._pwm = None
         super().__init__(active_high, initial_value)
 
     def _value_to_state(self, value):
@@ -320,6 +324,73 @@ class DigitalOutputDevice(OutputDevice, PinMixin):
     def _write(self, value):
         self._pin.value(self._value_to_state(value))
 
+    def blink(self, on_time=1, off_time=None, n=None, wait=False):
+        """
+        Makes the device turn on and off repeatedly.
+
+        A symmetric blink that repeats forever and is fast enough for a PWM
+        slice (at least :attr:`PWM_MIN_FREQ` hertz) is generated in hardware
+        at 50% duty, so no timer callbacks run while it is blinking. Any
+        other blink falls back to :meth:`OutputDevice.blink`.
+
+        :param float on_time:
+            The length of time in seconds that the device will be on. Defaults to 1.
+
+        :param float off_time:
+            The length of time in seconds that the device will be off. If `None`,
+            it will be the same as ``on_time``. Defaults to `None`.
+
+        :param int n:
+            The number of times to repeat the blink operation. If None is
+            specified, the device will continue blinking forever. The default
+            is None.
+
+        :param bool wait:
+           If True, the method will block until the device stops turning on and off.
+           If False, the method will return and the device will turn on and off in
+           the background. Defaults to False.
+        """
+        off_time = on_time if off_time is None else off_time
+
+        if (
+            n is None
+            and not wait
+            and on_time == off_time
+            and on_time > 0
+            and 1 / (on_time + off_time) >= DigitalOutputDevice.PWM_MIN_FREQ
+            and self._start_pwm_blink(int(round(1 / (on_time + off_time))))
+        ):
+            return
+
+        super().blink(on_time, off_time, n, wait)
+
+    def _start_pwm_blink(self, freq):
+        # The onboard LED is driven through the wireless chip and named pins
+        # cannot be muxed to a PWM slice.
+        if not isinstance(self._pin_num, int):
+            return False
+        channel = PWMOutputDevice.PIN_TO_PWM_CHANNEL[self._pin_num]
+        if channel in PWMOutputDevice._channels_used:
+            return False
+
+        self.off()
+        PWMOutputDevice._channels_used[channel] = self
+        self._pwm = PWM(self._pin)
+        self._pwm.freq(freq)
+        self._pwm.duty_u16(32768)
+        return True
+
+    def _stop_change(self):
+        super()._stop_change()
+        if self._pwm is not None:
+            self._pwm.deinit()
+            self._pwm = None
+            del PWMOutputDevice._channels_used[
+                PWMOutputDevice.PIN_TO_PWM_CHANNEL[self._pin_num]
+            ]
+            # Hand the pin back from the PWM slice to plain GPIO.
+            self._pin = Pin(self._pin_num, Pin.OUT)
+
     def close(self):
         """
         Closes the device and turns the device off. Once closed, the device
@@ -8,18 +8,31 @@ class Logging:
 
     _LOG_FILE: str = const("log.txt")
     _MAX_LINES: int = const(30)
+    # Size at which the log is trimmed back down to `_MAX_LINES`.
+    _MAX_BYTES: int = const(4096)
+    # Bytes read per step when scanning the log backwards.
+    _READ_CHUNK: int = const(512)
 
+    _BOOT_TIME: int = time.time()
+    _BOOT_STAMP: str = "%d:%d:%d::%d:%d:%d" % time.localtime(_BOOT_TIME)[:6]
 
-def log_record(record: str) -> None:
-    year, month, mday, hour, minute, second, _, _ = time.localtime()
-    header = f"{year}:{month}:{mday}::{hour}:{minute}:{second}@ "
-    _new_record = f"{header}{record}\n"
 
-    if Logging._LOG_FILE not in os.listdir():
+def log_record(record: str) -> None:
+    # Boot time plus seconds of uptime; avoids a localtime() tuple per record.
+    _new_record = "%s+%d@ %s\n" % (
+        Logging._BOOT_STAMP,
+        time.time() - Logging._BOOT_TIME,
+        record,
+    )
+
+    try:
+        size = os.stat(Logging._LOG_FILE)[6]
+    except OSError:
         log_new_record(_new_record)
-    else:
-        add_record(record=_new_record)
-        # delete_k_records(k=Logging._MAX_LINES)
+        return
+    add_record(record=_new_record)
+    if size + len(_new_record) > Logging._MAX_BYTES:
+        delete_k_records(k=Logging._MAX_LINES)
 
 
 def add_record(record: str) -> None:
@@ -30,15 +43,32 @@ def add_record(record: str) -> None:
 
 
 def delete_k_records(k: int) -> None:
-    """Deletes the first record in the log file."""
-    with open(Logging._LOG_FILE, "r") as f:
-        lines = f.readlines()
-        _delete_lines = max(0, len(lines) - k)
-        lines = lines[_delete_lines:]
-
-    with open(Logging._LOG_FILE, "w") as f:
-        for line in lines:
-            f.write(line)
+    """Deletes all but the last `k` records in the log file."""
+    with open(Logging._LOG_FILE, "rb") as f:
+        # Walk backwards to the newline preceding the last `k` records so only
+        # the surviving tail is ever read into memory.
+        offset = f.seek(0, 2)
+        found = 0
+        while offset > 0:
+            step = min(Logging._READ_CHUNK, offset)
+            offset -= step
+            f.seek(offset)
+            chunk = f.read(step)
+            i = len(chunk)
+            while found <= k:
+                i = chunk.rfind(b"\n", 0, i)
+                if i < 0:
+                    break
+                found += 1
+            if found > k:
+                offset += i + 1
+                break
+        f.seek(offset)
+        tail = f.read()
+
+    # MicroPython files cannot be truncated in place, so rewrite the tail.
+    with open(Logging._LOG_FILE, "wb") as f:
+        f.write(tail)
 
 
 def log_new_record(record: str) -> None:
@@ -47,14 +77,16 @@ def log_new_record(record: str) -> None:
 
 
 def log_dump():
-    def generate_log_stream():
-        with open(Logging._LOG_FILE, "r") as f:
-            for line in f.readlines():
-                yield str(line)
+    """Open the log for streaming.
 
-    return generate_log_stream()
+    Microdot sends file-like bodies in `Response.send_file_buffer_size` chunks
+    and closes the file once the response is written.
+    """
+    return open(Logging._LOG_FILE, "rb")
 
 
 def log_flush() -> None:
-    if Logging._LOG_FILE in os.listdir():
+    try:
         os.remove(Logging._LOG_FILE)
+    except OSError:
+        pass
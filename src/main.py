@@ -1,8 +1,14 @@
+import micropython
+
 from .connect import connect
 from .microdot_server import run as _run
 from .server_methods import load_devices
 from .logging import log_flush
 
+# Lets exceptions raised inside timer callbacks report a traceback instead of
+# failing to allocate one.
+micropython.alloc_emergency_exception_buf(100)
+
 
 def run() -> None:
     log_flush()
@@ -11,6 +11,7 @@ from .connect import (
 )
 from .server_methods import (
     StatusMessage,
+    api_method,
     change_pins,
     change_steps,
     get_devices,
@@ -23,12 +24,10 @@ from .server_methods import (
     reset_pins,
     toggle_pins,
     save_json,
-    led_flash,
     app_shutdown,
     app_reset,
     app_ota,
     ota_closure,
-    log_exception,
     add_favorite_profile,
     delete_favorite_profile,
 )
@@ -40,9 +39,13 @@ from .server_methods import (
 
 app = Microdot()
 
+# Constant responses are encoded once and reused by every request.
+_SUCCESS_RESPONSE = Response(body=StatusMessage._SUCCESS)
+_FAILURE_RESPONSE = Response(body=StatusMessage._FAILURE)
+
 
 @app.after_request
-async def server_log_request(request: Request, response: Response):
+def server_log_request(request: Request, response: Response):
     log_record(f"{request.url} - {response.status_code}")
 
 
@@ -52,51 +55,45 @@ async def server_log_request(request: Request, response: Response):
 
 
 @app.get("/")
-@log_exception
-@led_flash
-async def root(_: Request) -> str:
-    return StatusMessage._SUCCESS
+@api_method
+def root(_: Request) -> Response:
+    return _SUCCESS_RESPONSE
 
 
 @app.get("/scan")
-@log_exception
-@led_flash
-async def server_scan(_: Request) -> str:
+@api_method
+def server_scan(_: Request) -> str:
     return dumps(scan())
 
 
 @app.get("/network")
-@log_exception
-@led_flash
-async def server_network(_: Request) -> str:
+@api_method
+def server_network(_: Request) -> str:
     return dumps(NetworkInfo(nic_closure()).json)
 
 
 @app.get("/shutdown")
-@log_exception
-@led_flash
-async def server_app_shutdown(request: Request):
+@api_method
+def server_app_shutdown(request: Request) -> Response:
     app_shutdown()
     request.app.shutdown()
-    return StatusMessage._SUCCESS
+    return _SUCCESS_RESPONSE
 
 
 @app.get("/reset")
-@log_exception
-@led_flash
-async def server_app_reset(request: Request) -> str:
+@api_method
+def server_app_reset(request: Request) -> Response:
     app_reset()
     request.app.shutdown()
-    return StatusMessage._SUCCESS
+    return _SUCCESS_RESPONSE
 
 
 @app.get("/update")
-@log_exception
-@led_flash
-async def server_app_update(request: Request):
+@api_method
+def server_app_update(request: Request) -> Response:
     app_ota()
     request.app.shutdown()
-    return StatusMessage._SUCCESS
+    return _SUCCESS_RESPONSE
 
 
 ######################################################################
@@ -105,58 +102,37 @@ async def server_app_update(request: Request):
 
 
 @app.get("/devices")
-@log_exception
-@led_flash
-async def devices(_: Request) -> str:
+@api_method
+def devices(_: Request) -> str:
     return dumps(get_devices())
 
 
-@app.put("/devices/toggle/<pins>")
-@log_exception
-@led_flash
-async def devices_toggle_pins(_: Request, pins: str) -> str:
-    return dumps(toggle_pins(pins))
-
-
-@app.put("/devices/on/<pins>")
-@log_exception
-@led_flash
-async def devices_on_pins(_: Request, pins: str) -> str:
-    return dumps(on_pins(pins))
-
-
-@app.put("/devices/off/<pins>")
-@log_exception
-@led_flash
-async def devices_off_pins(_: Request, pins: str) -> str:
-    return dumps(off_pins(pins))
+@app.put("/devices/change/<pins>/<device_type>")
+@api_method
+def devices_change(request: Request, pins: str, device_type: str) -> str:
+    return dumps(change_pins(pins=pins, device_type=device_type, **request.args))
 
 
-@app.put("/devices/reset/<pins>")
-@log_exception
-@led_flash
-async def devices_reset_pins(_: Request, pins: str) -> str:
-    return dumps(reset_pins(pins))
+def pins_route(action):
+    """Build a handler that returns `action(pins)` as JSON."""
 
+    @api_method
+    def handler(_: Request, pins: str) -> str:
+        return dumps(action(pins))
 
-@app.put("/devices/change/<pins>/<device_type>")
-@log_exception
-@led_flash
-async def devices_change(request: Request, pins: str, device_type: str) -> str:
-    return dumps(change_pins(pins=pins, device_type=device_type, **request.args))
+    return handler
 
 
-@app.get("/devices/steps/<pins>")
-@log_exception
-@led_flash
-async def devices_steps(_: Request, pins: str) -> str:
-    return dumps(get_steps(pins))
+devices_toggle_pins = app.put("/devices/toggle/<pins>")(pins_route(toggle_pins))
+devices_on_pins = app.put("/devices/on/<pins>")(pins_route(on_pins))
+devices_off_pins = app.put("/devices/off/<pins>")(pins_route(off_pins))
+devices_reset_pins = app.put("/devices/reset/<pins>")(pins_route(reset_pins))
+devices_steps = app.get("/devices/steps/<pins>")(pins_route(get_steps))
 
 
 @app.put("/devices/steps/<pins>/<steps>")
-@log_exception
-@led_flash
-async def devices_steps_change(_: Request, pins: str, steps: str) -> str:
+@api_method
+def devices_steps_change(_: Request, pins: str, steps: str) -> str:
     return dumps(change_steps(pins, steps))
 
 
@@ -166,16 +142,14 @@ async def devices_steps_change(_: Request, pins: str, steps: str) -> str:
 
 
 @app.get("/profiles")
-@log_exception
-@led_flash
-async def profiles(_: Request) -> str:
+@api_method
+def profiles(_: Request) -> str:
     return dumps(get_profiles())
 
 
 @app.put("/profiles")
-@log_exception
-@led_flash
-async def devices_load_json(request: Request) -> str:
+@api_method
+def devices_load_json(request: Request) -> str:
     if request.json is not None:
         return dumps(load_json(request.json))
     else:
@@ -183,9 +157,8 @@ async def devices_load_json(request: Request) -> str:
 
 
 @app.post("/profiles")
-@log_exception
-@led_flash
-async def profiles_save(request: Request) -> str:
+@api_method
+def profiles_save(request: Request) -> str:
     if request.json is not None:
         return dumps(save_json(request.json))
     else:
@@ -193,9 +166,8 @@ async def profiles_save(request: Request) -> str:
 
 
 @app.delete("/profiles")
-@log_exception
-@led_flash
-async def profiles_delete(request: Request) -> str:
+@api_method
+def profiles_delete(request: Request) -> str:
     if request.json is not None:
         return dumps(remove_json(request.json))
     else:
@@ -203,9 +175,8 @@ async def profiles_delete(request: Request) -> str:
 
 
 @app.post("/profiles/favorite")
-@log_exception
-@led_flash
-async def profiles_favorite_add(request: Request) -> str:
+@api_method
+def profiles_favorite_add(request: Request) -> str:
     if request.json is not None:
         return dumps(add_favorite_profile(request.json))
     else:
@@ -213,9 +184,8 @@ async def profiles_favorite_add(request: Request) -> str:
 
 
 @app.delete("/profiles/favorite")
-@log_exception
-@led_flash
-async def profiles_favorite_delete(request: Request) -> str:
+@api_method
+def profiles_favorite_delete(request: Request) -> str:
     return dumps(delete_favorite_profile())
 
 
@@ -225,31 +195,29 @@ async def profiles_favorite_delete(request: Request) -> str:
 
 
 @app.post("/credentials")
-@log_exception
-@led_flash
-async def server_save_credentials(request: Request) -> str:
+@api_method
+def server_save_credentials(request: Request) -> Response:
     json = request.json
     if json is None:
         log_record("Credentials were empty")
-        return StatusMessage._FAILURE
+        return _FAILURE_RESPONSE
     else:
         try:
             _save_credentials(json)
-            return StatusMessage._SUCCESS
+            return _SUCCESS_RESPONSE
         except KeyError:
             log_record("Credentials had bad keys")
-            return StatusMessage._FAILURE
+            return _FAILURE_RESPONSE
         except Exception as e:
             log_record(f"Failed with {e}")
-            return StatusMessage._FAILURE
+            return _FAILURE_RESPONSE
 
 
 @app.delete("/credentials")
-@log_exception
-@led_flash
-async def server_reset_credentials(_: Request) -> str:
+@api_method
+def server_reset_credentials(_: Request) -> Response:
     reset_credentials()
-    return StatusMessage._SUCCESS
+    return _SUCCESS_RESPONSE
 
 
 ######################################################################
@@ -258,18 +226,16 @@ async def server_reset_credentials(_: Request) -> str:
 
 
 @app.get("/log")
-@log_exception
-@led_flash
-async def server_log(_: Request):
+@api_method
+def server_log(_: Request):
     return log_dump()
 
 
 @app.delete("/log")
-@log_exception
-@led_flash
-async def server_log_flush(_: Request):
+@api_method
+def server_log_flush(_: Request) -> Response:
     log_flush()
-    return StatusMessage._SUCCESS
+    return _SUCCESS_RESPONSE
 
 
 def run() -> None:
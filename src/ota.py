@@ -1,7 +1,11 @@
 import os
 import gc
 import json
+import hashlib
+import socket
+import ssl
 import urequests
+from binascii import hexlify
 from micropython import const
 
 
@@ -44,23 +48,44 @@ class VersionInfo:
     """
 
     _NO_VERSION: str = const("__NO_VERSION__")
+    _TEMP_SUFFIX: str = const(".tmp")
     manifest: str
     content: dict[str, str] = dict()
 
     def __init__(self, manifest: str) -> None:
         self.manifest = manifest
+        self._dirty = False
         # Load content from file.
         if self.manifest in os.listdir():
             with open(self.manifest) as f:
                 self.content = json.load(f)
-        # Or set to an empty dict().
+        # Or start from an empty dict() that is written on the next flush.
         else:
-            self.write_versions_to_file(versions=dict())
+            self.content = dict()
+            self._dirty = True
 
     def write_versions_to_file(self, versions: dict[str, str]) -> None:
-        self.content.update(versions)
-        with open(self.manifest, "w") as f:
+        """Record new versions in memory, to be written by `flush`."""
+        content = self.content
+        for file, version in versions.items():
+            if content.get(file) != version:
+                content[file] = version
+                self._dirty = True
+
+    def flush(self) -> None:
+        """Write the manifest to disk if it changed since the last flush.
+
+        Notes:
+            The manifest is written to a temporary file and renamed over the
+            old one, so a power loss mid-write never leaves a truncated file.
+        """
+        if not self._dirty:
+            return
+        temp = self.manifest + self._TEMP_SUFFIX
+        with open(temp, "w") as f:
             json.dump(self.content, f)
+        os.rename(temp, self.manifest)
+        self._dirty = False
 
     def version(self, file: str) -> str:
         """Retrieve the active version for a file in the manifest."""
@@ -136,25 +161,164 @@ class RemoteConfig(BaseConfig):
                 }
         """
         response = urequests.get(remote_url.url + self._REMOTE_VERSION)
-        if response.status_code == 200:
-            remote_config = json.loads(response.content)
-            if self._TAG_KEY in remote_config and self._FILES_KEY in remote_config:
-                # Resolve tags & files dynamically.
-                self.tag = remote_config[self._TAG_KEY]
-                self.files = remote_config[self._FILES_KEY]
-                # Set the `repo_url` based off this info.
-                self.repo_url = RepoURL(
-                    user=remote_url.user,
-                    repo=remote_url.repo,
-                    # Now substitute in the tag dynamically.
-                    version=self.tag,
-                )
+        try:
+            if response.status_code == 200:
+                # Parse off the socket so the body is never buffered whole.
+                remote_config = json.load(response.raw)
+                if self._TAG_KEY in remote_config and self._FILES_KEY in remote_config:
+                    # Resolve tags & files dynamically.
+                    self.tag = remote_config[self._TAG_KEY]
+                    self.files = remote_config[self._FILES_KEY]
+                    # Set the `repo_url` based off this info.
+                    self.repo_url = RepoURL(
+                        user=remote_url.user,
+                        repo=remote_url.repo,
+                        # Now substitute in the tag dynamically.
+                        version=self.tag,
+                    )
+                else:
+                    raise KeyError(
+                        f"{self._TAG_KEY} and {self._FILES_KEY} must be present."
+                    )
             else:
-                raise KeyError(
-                    f"{self._TAG_KEY} and {self._FILES_KEY} must be present."
-                )
-        else:
-            raise NotImplementedError("Remote configuration was not found.")
+                raise NotImplementedError("Remote configuration was not found.")
+        finally:
+            response.close()
+
+
+######################################################################
+# HTTP Session
+######################################################################
+
+
+class SessionResponse:
+    """A response whose body is read off a kept-alive `Session` socket.
+
+    Attributes:
+        status_code: HTTP status code of the response.
+        headers: response headers, keyed by lower case name.
+        raw: stream supporting `readinto`, bounded to this response's body.
+    """
+
+    _NO_BODY: tuple[int, ...] = (204, 304)
+    status_code: int
+    headers: dict[str, str]
+
+    def __init__(self, session: "Session", status_code: int, headers: dict) -> None:
+        self._session = session
+        self.status_code = status_code
+        self.headers = headers
+        self.raw = self
+        self._chunked = headers.get("transfer-encoding", "").lower() == "chunked"
+        # Without a length or chunking, the body runs until the server closes.
+        self._to_close = (
+            not self._chunked
+            and "content-length" not in headers
+            and status_code not in self._NO_BODY
+        )
+        self._remaining = int(headers.get("content-length", 0))
+        self._keep_alive = (
+            not self._to_close and headers.get("connection", "").lower() != "close"
+        )
+
+    def readinto(self, buffer) -> int:
+        sock = self._session.sock
+        if self._to_close:
+            return sock.readinto(buffer)
+        if self._chunked and self._remaining == 0:
+            self._remaining = int(sock.readline().split(b";")[0], 16)
+            if self._remaining == 0:
+                # Skip trailers up to the closing blank line.
+                while sock.readline() not in (b"\r\n", b""):
+                    pass
+                self._chunked = False
+                return 0
+        n = min(len(buffer), self._remaining)
+        if n == 0:
+            return 0
+        n = sock.readinto(memoryview(buffer)[:n])
+        if not n:
+            raise OSError("Connection closed mid-response.")
+        self._remaining -= n
+        if self._chunked and self._remaining == 0:
+            sock.readline()  # CRLF terminating the chunk.
+        return n
+
+    def close(self) -> None:
+        """Drain any unread body so the connection can serve the next request."""
+        if not self._keep_alive:
+            self._session.close()
+            return
+        buffer = bytearray(OTAUpdate._CHUNK_SIZE)
+        try:
+            while self.readinto(buffer):
+                pass
+        except OSError:
+            # The connection already failed (possibly mid-read by the caller);
+            # drop it rather than mask the original error.
+            self._session.close()
+
+
+class Session:
+    """Minimal HTTP/1.1 client reusing one (TLS) connection across GETs.
+
+    Notes:
+        `urequests` opens a new connection per request, which for https costs a
+        full TLS handshake per file.
+    """
+
+    sock = None
+    host: str = ""
+
+    def get(self, url: str, headers: dict[str, str] = {}) -> SessionResponse:
+        """Send a GET, reconnecting once if a kept-alive socket went stale."""
+        scheme, _, host, path = url.split("/", 3)
+        reuse = self.sock is not None and host == self.host
+        if not reuse:
+            self.connect(host=host, secure=scheme == "https:")
+        try:
+            return self._get(host=host, path=path, headers=headers)
+        except OSError:
+            if not reuse:
+                raise
+            self.connect(host=host, secure=scheme == "https:")
+            return self._get(host=host, path=path, headers=headers)
+
+    def _get(self, host: str, path: str, headers: dict[str, str]) -> SessionResponse:
+        request = f"GET /{path} HTTP/1.1\r\nHost: {host}\r\n"
+        for k, v in headers.items():
+            request += f"{k}: {v}\r\n"
+        request += "Connection: keep-alive\r\n\r\n"
+        self.sock.write(request.encode())
+        status = self.sock.readline().split(None, 2)
+        if len(status) < 2:
+            raise OSError("Connection closed before a response.")
+        response_headers: dict[str, str] = {}
+        while True:
+            line = self.sock.readline()
+            if line in (b"\r\n", b""):
+                break
+            key, _, value = line.decode().partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+        return SessionResponse(
+            self, status_code=int(status[1]), headers=response_headers
+        )
+
+    def connect(self, host: str, secure: bool) -> None:
+        self.close()
+        name, _, port = host.partition(":")
+        port = int(port) if port else 443 if secure else 80
+        sock = socket.socket()
+        sock.connect(socket.getaddrinfo(name, port)[0][-1])
+        if secure:
+            sock = ssl.wrap_socket(sock, server_hostname=name)
+        self.sock = sock
+        self.host = host
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
 
 
 ######################################################################
@@ -165,7 +329,11 @@ class RemoteConfig(BaseConfig):
 class OTAUpdate:
     """Main class responsible for conducting OTAUpdates."""
 
+    _CHUNK_SIZE: int = const(512)
+    _TEMP_SUFFIX: str = const(".tmp")
+    _GC_MIN_FREE: int = const(16384)
     info: VersionInfo
+    session: Session
 
     def __init__(self, config: BaseConfig) -> None:
         """Perform an OTA based upon a configuration.
@@ -178,31 +346,47 @@ class OTAUpdate:
             config: a configuration containing information needed to update.
         """
         self.info = VersionInfo(manifest=config.manifest)
-        for file in config.files:
-            self.update(
-                repo_url=config.repo_url.url,
-                file=file,
-                tag=config.tag,
-            )
-            # Attempt to free up memory between iterations.
-            gc.collect()
+        # One connection serves every file in the config.
+        self.session = Session()
+        # Directories already ensured by `write_to_file`.
+        self._directories: set[str] = set()
+        try:
+            for file in config.files:
+                self.update(
+                    repo_url=config.repo_url.url,
+                    file=file,
+                    tag=config.tag,
+                )
+                # Only pay for a full heap scan once memory is actually tight.
+                if gc.mem_free() < self._GC_MIN_FREE:
+                    gc.collect()
+        finally:
+            # Record every file renamed into place, even if a later one failed.
+            self.info.flush()
+            self.session.close()
 
     def update(self, repo_url: str, file: str, tag: str) -> None:
         """Set the latest code for a specific file from a remote repo."""
-        # If using hashing, we determine the "tag" based off the hash of the response.
+        # If using hashing, the "tag" is the server's ETag for the file (or the
+        # hash of the response when there is none). Sending the stored version
+        # back as If-None-Match lets an unchanged file come back as a bodiless
+        # 304, which `_update` defers.
         if tag == BaseConfig.tag:
-            # Get the latest code from the repo.
-            response = urequests.get(repo_url + file)
+            version = self.info.version(file=file)
+            headers: dict[str, str] = {}
+            if version != VersionInfo._NO_VERSION:
+                headers["If-None-Match"] = version
+            response = self.session.get(repo_url + file, headers=headers)
             self._update(
                 response=response,
                 file=file,
-                new_version=str(hash(response.content)),
+                new_version=response.headers.get("etag"),
             )
         # Otherwise, use the tag provided. Note, now the version check happens
         # before pulling down any code.
         elif tag != self.info.version(file=file):
-            response = self._update(
-                response=urequests.get(repo_url + file),
+            self._update(
+                response=self.session.get(repo_url + file),
                 file=file,
                 new_version=tag,
             )
@@ -210,25 +394,65 @@ class OTAUpdate:
             print(file + " deferred...")
 
     def _update(self, response, file: str, new_version: str) -> None:
-        """Helper function to unpack a response and update a version."""
-        if response.status_code == 200 and new_version != self.info.version(file=file):
-            self.write_to_file(file, response.content)
-            # Write the new version to "disk".
-            self.info.write_versions_to_file(versions={const(file): new_version})
+        """Helper function to unpack a response and update a version.
+
+        Notes:
+            `new_version` may be `None`, in which case the hash of the body is
+            used. The body is streamed into a temporary file first so that the
+            hash is computed without holding the file in memory.
+        """
+        try:
+            if response.status_code != 200:
+                print(file + " deferred...")
+                return
+            temp = file + self._TEMP_SUFFIX
+            try:
+                digest = self.write_to_file(temp, response)
+            except Exception:
+                # Don't leave a partial download taking up flash.
+                try:
+                    os.remove(temp)
+                except OSError:
+                    pass
+                raise
+        finally:
+            response.close()
+
+        if new_version is None:
+            new_version = digest
+        if new_version != self.info.version(file=file):
+            os.rename(temp, file)
+            # Stage the new version; `flush` writes the manifest once.
+            self.info.write_versions_to_file(versions={file: new_version})
             print(file + " updated...")
         else:
+            os.remove(temp)
             print(file + " deferred...")
 
-    @staticmethod
-    def write_to_file(file: str, content: str) -> None:
-        """Ensure a directory exists before writing contents to a file."""
-        _DELIM: str = const("/")
-        if file.find(_DELIM) != -1:
+    def write_to_file(self, file: str, response) -> str:
+        """Ensure a directory exists, then stream a response body into a file.
+
+        Returns:
+            hex encoded sha256 of the body.
+        """
+        i = file.rfind("/")
+        if i != -1:
             # Strip all but the last prefix (aka the directory).
-            prefix = _DELIM.join(file.split(_DELIM)[:-1])
-            try:
-                os.mkdir(prefix)
-            except OSError:
-                pass
-        with open(file, "w") as f:
-            f.write(content)
+            prefix = file[:i]
+            if prefix not in self._directories:
+                try:
+                    os.mkdir(prefix)
+                except OSError:
+                    pass
+                self._directories.add(prefix)
+        digest = hashlib.sha256()
+        buffer = bytearray(OTAUpdate._CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file, "wb") as f:
+            while True:
+                n = response.raw.readinto(buffer)
+                if not n:
+                    break
+                f.write(view[:n])
+                digest.update(view[:n])
+        return hexlify(digest.digest()).decode()
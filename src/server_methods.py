@@ -24,8 +24,9 @@ class ServerMethods:
     # Raspberry Pi Pico W RP2040 layout
     GPIO_PINS: set[int] = set(range(29))
 
-    # container for holding our devices - load or initialize
-    devices: OrderedDict[str, BinaryDevice] = OrderedDict({})
+    # container for holding our devices - load or initialize.
+    # Keyed by a bitmask of the device's pins, see `pins_to_key`.
+    devices: OrderedDict[int, BinaryDevice] = OrderedDict({})
     pin_pool: set[int] = GPIO_PINS.copy()
 
     # Upon shutdown, this will enable a ota update.
@@ -40,12 +41,33 @@ class ServerMethods:
 
     # TODO: Eventually, we want to send both the device type name and the required
     # number of pins. But for now, just give the device type names.
-    DEVICE_TYPES: list[str] = list(
-        {k: {const("requirement"): v.required_pins} for k, v in CLS_MAP.items()}.keys()
-    )
+    DEVICE_TYPES: list[str] = list(CLS_MAP.keys())
 
     APP_RESET_WAIT_TIME: int = 3
 
+    # Last `get_profiles` result, rebuilt only after the profiles on disk change.
+    _profiles_cache: dict[str, list[str]] = {}
+    _profiles_dirty: bool = True
+    # Favorite profile name mirrored from disk; `None` until read or written.
+    _favorite: str | None = None
+
+    # Pin pairs given a default device when no profile is loaded.
+    DEFAULT_PINS: tuple[tuple[int, int], ...] = (
+        (0, 1),
+        (2, 3),
+        (4, 5),
+        (6, 7),
+        (8, 9),
+        (10, 11),
+        (12, 13),
+        (14, 15),
+        (16, 17),
+        (18, 19),
+        (20, 21),
+        (22, 26),
+        (27, 28),
+    )
+
 
 ######################################################################
 # API Return Types
@@ -68,6 +90,39 @@ class ResponseKey(object):
     _FAVORITE_PROFILE: str = const("favorite_profile")
 
 
+######################################################################
+# Decorators
+######################################################################
+
+
+def api_method(func):
+    """Flash the LED for the duration of a handler and log any exception."""
+    # Bound once per route so each request skips the attribute lookups.
+    led_on = pico_led.on
+    led_off = pico_led.off
+
+    def wrapper(*args, **kwargs):
+        led_on()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            log_exception_traceback(e=e)
+        finally:
+            led_off()
+
+    return wrapper
+
+
+def with_device(func):
+    """Resolve a csv of pins to its device before calling `func(device, ...)`."""
+
+    def wrapper(pins: str, *args):
+        # Looked up per call, loading a profile replaces the whole dict.
+        return func(ServerMethods.devices[convert_csv_key(pins)], *args)
+
+    return wrapper
+
+
 ######################################################################
 # API Methods
 ######################################################################
@@ -78,36 +133,33 @@ def get_devices() -> dict[str, list[dict[str, object]]]:
     return get_return_dict(ServerMethods.devices)
 
 
-def toggle_pins(pins: str) -> dict[str, list[dict[str, object]]]:
+@with_device
+def toggle_pins(device: BinaryDevice) -> dict[str, list[dict[str, object]]]:
     """Toggle the state of a device, or set to "self.on_state" by default."""
-    _pins = str(convert_csv_tuples(pins))
-    device = ServerMethods.devices[_pins]
     if device.state == device.on_state:
-        ServerMethods.devices[_pins].action(device.off_state)
+        device.action(device.off_state)
     else:
-        ServerMethods.devices[_pins].action(device.on_state)
-    return get_return_dict(OrderedDict({const(_pins): ServerMethods.devices[_pins]}))
+        device.action(device.on_state)
+    return {ResponseKey._DEVICES: [device.to_json()]}
 
 
-def on_pins(pins: str) -> dict[str, list[dict[str, object]]]:
-    _pins = str(convert_csv_tuples(pins))
-    device = ServerMethods.devices[_pins]
-    ServerMethods.devices[_pins].action(device.on_state)
-    return get_return_dict(OrderedDict({const(_pins): ServerMethods.devices[_pins]}))
+@with_device
+def on_pins(device: BinaryDevice) -> dict[str, list[dict[str, object]]]:
+    device.action(device.on_state)
+    return {ResponseKey._DEVICES: [device.to_json()]}
 
 
-def off_pins(pins: str) -> dict[str, list[dict[str, object]]]:
-    _pins = str(convert_csv_tuples(pins))
-    device = ServerMethods.devices[_pins]
-    ServerMethods.devices[_pins].action(device.off_state)
-    return get_return_dict(OrderedDict({const(_pins): ServerMethods.devices[_pins]}))
+@with_device
+def off_pins(device: BinaryDevice) -> dict[str, list[dict[str, object]]]:
+    device.action(device.off_state)
+    return {ResponseKey._DEVICES: [device.to_json()]}
 
 
-def reset_pins(pins: str) -> dict[str, list[dict[str, object]]]:
+@with_device
+def reset_pins(device: BinaryDevice) -> dict[str, list[dict[str, object]]]:
     """Reset the state of a device at a given set of pins."""
-    _pins = str(convert_csv_tuples(pins))
-    ServerMethods.devices[_pins].action(None)  # type: ignore
-    return get_return_dict(OrderedDict({const(_pins): ServerMethods.devices[_pins]}))
+    device.action(None)  # type: ignore
+    return {ResponseKey._DEVICES: [device.to_json()]}
 
 
 def change_pins(
@@ -120,10 +172,11 @@ def change_pins(
     """
     new_cls = CLS_MAP.get(device_type, None)
     _pins = convert_csv_tuples(pins)
+    _key = pins_to_key(_pins)
 
     # Need the new class and ensure the pins were already being used.
-    if new_cls is not None and str(_pins) in ServerMethods.devices:
-        current_device = ServerMethods.devices[str(_pins)]
+    if new_cls is not None and _key in ServerMethods.devices:
+        current_device = ServerMethods.devices[_key]
         current_pin_amount = current_device.required_pins
 
         # Needs the same amount of pins.
@@ -154,10 +207,8 @@ def change_pins(
                 )
 
         # Update the devices.
-        ServerMethods.devices.update({const(str(_pins)): new_device})
-        return get_return_dict(
-            OrderedDict({const(str(_pins)): ServerMethods.devices[str(_pins)]})
-        )
+        ServerMethods.devices[_key] = new_device
+        return get_return_dict({_key: ServerMethods.devices[_key]})
     else:
         raise ValueError(
             f"Requested Device Type not found or pins {str(_pins)} were not already in use."
@@ -166,17 +217,21 @@ def change_pins(
 
 def get_profiles() -> dict[str, list[str]]:
     """Get all the profile names without file extension."""
-    profiles = os.listdir(ServerMethods._PROFILE_PATH)
-    profiles = [i.split(".")[0] for i in profiles]
-    profiles.sort()
+    if not ServerMethods._profiles_dirty:
+        return ServerMethods._profiles_cache
+    profiles = sorted(
+        i.rsplit(".", 1)[0] for i in os.listdir(ServerMethods._PROFILE_PATH)
+    )
     _favorite: list[str] = []
     if ServerMethods._FAVORITE_FILE in profiles:
         profiles.remove(ServerMethods._FAVORITE_FILE)
         _favorite = [get_favorite_profile()]
-    return {
-        const(ResponseKey._PROFILES): profiles,
-        const(ResponseKey._FAVORITE_PROFILE): _favorite,
+    ServerMethods._profiles_cache = {
+        ResponseKey._PROFILES: profiles,
+        ResponseKey._FAVORITE_PROFILE: _favorite,
     }
+    ServerMethods._profiles_dirty = False
+    return ServerMethods._profiles_cache
 
 
 def load_json(json: dict[str, str]) -> dict[str, list[dict[str, object]]]:
@@ -184,12 +239,9 @@ def load_json(json: dict[str, str]) -> dict[str, list[dict[str, object]]]:
     name = read_profile_json(json)
     path: str = ServerMethods._PROFILE_PATH + name + ".json"
 
-    # Load a json string from a file stream.
+    # Parse the config straight off the file stream as an unordered dictionary.
     with open(path, "r") as f:
-        json_str: str = f.read()
-
-    # Load the config as an unordered dictionary.
-    _cfg: dict[str, dict[str, object]] = ujson.loads(json_str)
+        _cfg: dict[str, dict[str, object]] = ujson.load(f)
     order = _cfg["order"]
 
     # Reorder the config with the saved order.
@@ -209,6 +261,7 @@ def remove_json(json: dict[str, str]) -> dict[str, list[str]]:
     name = read_profile_json(json)
     path = ServerMethods._PROFILE_PATH + name + ".json"
     os.remove(path)
+    ServerMethods._profiles_dirty = True
     if name == get_favorite_profile():
         remove_favorite()
     return get_profiles()
@@ -218,17 +271,20 @@ def save_json(json: dict[str, str]) -> dict[str, list[str]]:
     """Save a JSON profile."""
     name = read_profile_json(json)
     path: str = ServerMethods._PROFILE_PATH + name.strip() + ".json"
-    devices_json = devices_to_json(ServerMethods.devices)
+    devices_json: dict[str, object] = {}
     order: list[str] = []
 
     # NOTE: Explicitly save the order of the keys since ujson
     # does not maintain order when decoding.
-    for k in devices_json.keys():
-        order += [k]
+    for d in ServerMethods.devices.values():
+        k = str(d.pin)
+        devices_json[k] = d.to_json()
+        order.append(k)
 
-    devices_json["order"] = order  # type: ignore
+    devices_json["order"] = order
     with open(path, "w") as f:
         ujson.dump(devices_json, f)
+    ServerMethods._profiles_dirty = True
     return get_profiles()
 
 
@@ -249,19 +305,23 @@ def delete_favorite_profile() -> dict[str, list[str]]:
 
 def post(pins: str, device_type: str) -> dict[str, list[dict[str, object]]]:
     """Add a new device."""
+    post_pins(convert_csv_tuples(pins), device_type)
+    return get_return_dict(ServerMethods.devices)
+
+
+def post_pins(pins: tuple[int, ...], device_type: str) -> None:
+    """Add a new device on an already parsed, sorted tuple of pins."""
     device_cls = CLS_MAP.get(device_type, None)
     # device type must be legal
     if device_cls is not None:
-        _pins = convert_csv_tuples(pins)
         # pins must be available and not the same
-        _available = all([p in ServerMethods.pin_pool for p in _pins])
-        if _available and len(set(_pins)) == len(_pins):
-            added = device_cls(pin=_pins)
+        _pins = set(pins)
+        if len(_pins) == len(pins) and _pins.issubset(ServerMethods.pin_pool):
+            added = device_cls(pin=pins)
             # add to global container
-            ServerMethods.devices.update({const(str(_pins)): added})
+            ServerMethods.devices[pins_to_key(pins)] = added
             # remove availability
-            _ = [ServerMethods.pin_pool.remove(p) for p in added.pin_list]
-            return get_return_dict(ServerMethods.devices)
+            ServerMethods.pin_pool.difference_update(added.pin)
         else:
             raise ValueError("Requested pins were not available or not unique.")
     else:
@@ -285,48 +345,23 @@ def app_ota() -> None:
     ServerMethods.update_flag = True
 
 
-def get_steps(pins: str) -> int:
-    _pins = str(convert_csv_tuples(pins))
-    device = ServerMethods.devices[_pins]
+@with_device
+def get_steps(device: BinaryDevice) -> int:
     if hasattr(device, "steps"):
-        return ServerMethods.devices[_pins].steps
+        return device.steps
     else:
         raise ValueError(f"Expecting the device to have steps. Found {type(device)}.")
 
 
-def change_steps(pins: str, steps: str) -> dict[str, list[dict[str, object]]]:
-    _pins = str(convert_csv_tuples(pins))
-    device = ServerMethods.devices[_pins]
+@with_device
+def change_steps(
+    device: BinaryDevice, steps: str
+) -> dict[str, list[dict[str, object]]]:
     if hasattr(device, "steps"):
-        ServerMethods.devices[_pins].steps = int(steps)
+        device.steps = int(steps)
     else:
         raise ValueError(f"Expecting the device to have steps. Found {type(device)}.")
-    return get_return_dict(OrderedDict({const(_pins): ServerMethods.devices[_pins]}))
-
-
-######################################################################
-# Decorators
-######################################################################
-
-
-def led_flash(func):
-    async def wrapper(*args, **kwargs):
-        pico_led.on()
-        results = await func(*args, **kwargs)
-        pico_led.off()
-        return results
-
-    return wrapper
-
-
-def log_exception(func):
-    async def new_func(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            log_exception_traceback(e=e)
-
-    return new_func
+    return {ResponseKey._DEVICES: [device.to_json()]}
 
 
 ######################################################################
@@ -335,19 +370,8 @@ def log_exception(func):
 
 
 def load_default_devices() -> None:
-    post("0,1", DEFAULT_DEVICE)  # 1
-    post("2,3", DEFAULT_DEVICE)  # 2
-    post("4,5", DEFAULT_DEVICE)  # 3
-    post("6,7", DEFAULT_DEVICE)  # 4
-    post("8,9", DEFAULT_DEVICE)  # 5
-    post("10,11", DEFAULT_DEVICE)  # 6
-    post("12,13", DEFAULT_DEVICE)  # 7
-    post("14,15", DEFAULT_DEVICE)  # 8
-    post("16,17", DEFAULT_DEVICE)  # 9
-    post("18,19", DEFAULT_DEVICE)  # 10
-    post("20,21", DEFAULT_DEVICE)  # 11
-    post("22,26", DEFAULT_DEVICE)  # 12
-    post("27,28", DEFAULT_DEVICE)  # 13
+    for pins in ServerMethods.DEFAULT_PINS:
+        post_pins(pins, DEFAULT_DEVICE)
 
 
 def load_devices() -> None:
@@ -357,7 +381,7 @@ def load_devices() -> None:
 
     if favorites and len(favorites) == 1 and profiles and favorites[0] in profiles:
         try:
-            load_json({const(ProfileRequest._NAME): favorites[0]})
+            load_json({ProfileRequest._NAME: favorites[0]})
         except Exception as e:
             log_record(f"Could not load {favorites}, {e}")
             load_default_devices()
@@ -377,22 +401,10 @@ def log_exception_traceback(e: Exception) -> None:
 
 
 def get_return_dict(
-    devices: OrderedDict[str, BinaryDevice]
+    devices: dict[int, BinaryDevice]
 ) -> dict[str, list[dict[str, object]]]:
     """Return a json-returnable dict for an app call."""
-    return {const(ResponseKey._DEVICES): list(devices_to_json(devices).values())}
-
-
-def devices_to_json(
-    devices: OrderedDict[str, BinaryDevice]
-) -> OrderedDict[str, dict[str, object]]:
-    """Return a serializiable {str(pins): str(device)} mapping of devices."""
-    devices_json: OrderedDict[str, dict[str, object]] = OrderedDict({})
-    # NOTE: Use __iter__ instead of list comprehension to maintain
-    # ordering of OrderedDict.
-    for pin, d in devices.items():
-        devices_json.update({const(str(pin)): d.to_json()})
-    return devices_json
+    return {ResponseKey._DEVICES: [d.to_json() for d in devices.values()]}
 
 
 def read_profile_json(json: dict[str, str]) -> str:
@@ -410,28 +422,36 @@ def read_favorite_profile_json(json: dict[str, str]) -> str:
 
 
 def get_favorite_profile() -> str:
-    with open(ServerMethods._FAVORITE_PATH, "r") as f:
-        _favorite = f.read()
+    _favorite = ServerMethods._favorite
+    if _favorite is None:
+        with open(ServerMethods._FAVORITE_PATH, "r") as f:
+            _favorite = f.read()
+        ServerMethods._favorite = _favorite
     return _favorite
 
 
 def write_favorite_profile(favorite: str) -> None:
     with open(ServerMethods._FAVORITE_PATH, "w") as f:
         f.write(favorite)
+    ServerMethods._favorite = favorite
+    ServerMethods._profiles_dirty = True
 
 
 def remove_favorite() -> None:
+    ServerMethods._favorite = None
     os.remove(ServerMethods._FAVORITE_PATH)
+    ServerMethods._profiles_dirty = True
 
 
-def close_devices(devices: OrderedDict[str, BinaryDevice]) -> None:
+def close_devices(devices: OrderedDict[int, BinaryDevice]) -> None:
     """Close all connections in a dictionary of devices."""
-    # close all pre existing connections
-    for _, device in devices.items():
+    # Nothing to close, so skip the full heap scan as well.
+    if not devices:
+        return
+    # close all pre existing connections and return their pins to the pool
+    for device in devices.values():
         device.close()
-    del devices
-    # reset the pin pool
-    ServerMethods.pin_pool = update_pin_pool(OrderedDict({}))
+        ServerMethods.pin_pool.update(device.pin)
     gc.collect()
 
 
@@ -441,37 +461,52 @@ def close_devices_closure() -> None:
 
 def construct_from_cfg(
     cfg: OrderedDict[str, dict[str, object]]
-) -> OrderedDict[str, BinaryDevice]:
+) -> OrderedDict[int, BinaryDevice]:
     """Construct a new dictionary of devices from a configuration."""
     # construct switches from config
-    devices: OrderedDict[str, BinaryDevice] = OrderedDict({})
-    for _, v in cfg.items():
+    devices: OrderedDict[int, BinaryDevice] = OrderedDict({})
+    get_cls = CLS_MAP.get
+    for v in cfg.values():
         _pins: tuple[int] = tuple(v["pins"])  # type: ignore
-        _k: str = const(str(_pins))
-        _v: BinaryDevice = CLS_MAP.get(v["name"])(pin=_pins)  # type: ignore
-        devices.update({const(_k): _v})
-    # Set states from configuration
-    for k, v in devices.items():
+        _v: BinaryDevice = get_cls(v["name"])(pin=_pins)  # type: ignore
+        # Set state from configuration
         # NOTE: Actually passes an Optional[str]
-        v.action(cfg[str(k)]["state"])  # type: ignore
+        _v.action(v["state"])  # type: ignore
+        devices[pins_to_key(_pins)] = _v
     return devices
 
 
 def convert_csv_tuples(inputs: str) -> tuple[int, ...]:
     """Convert a comma seperated list of pins."""
     inputs_split: list[str] = inputs.split(",")
-    inputs_int: list[int] = [int(input) for input in inputs_split]
-    inputs_int.sort()
-    return tuple(inputs_int)
+    # Fast path for the common two pin device.
+    if len(inputs_split) == 2:
+        a, b = int(inputs_split[0]), int(inputs_split[1])
+        return (a, b) if a <= b else (b, a)
+    return tuple(sorted(int(input) for input in inputs_split))
+
+
+def convert_csv_key(inputs: str) -> int:
+    """Convert a comma seperated list of pins straight to a device key."""
+    key = 0
+    for input in inputs.split(","):
+        key |= 1 << int(input)
+    return key
+
+
+def pins_to_key(pins: tuple[int, ...]) -> int:
+    """Pack pins into an int bitmask, independent of their order."""
+    key = 0
+    for p in pins:
+        key |= 1 << p
+    return key
 
 
 def sort_pool(pool: set[int]) -> list[int]:
-    _pool = list(pool)
-    _pool.sort()
-    return _pool
+    return sorted(pool)
 
 
-def update_pin_pool(devices: OrderedDict[str, BinaryDevice]) -> set[int]:
+def update_pin_pool(devices: OrderedDict[int, BinaryDevice]) -> set[int]:
     """Update a pool of pins based off current devices."""
 
     class PinNotInPinPool(Exception):
@@ -480,13 +515,11 @@ def update_pin_pool(devices: OrderedDict[str, BinaryDevice]) -> set[int]:
         pass
 
     pin_pool = ServerMethods.GPIO_PINS.copy()
-    for _, d in devices.items():
-        for p in d.pin_list:
-            if p not in pin_pool:
-                raise PinNotInPinPool(
-                    f"pin {p}, {type(p)} was not in pin pool: {pin_pool}."
-                )
-            pin_pool.remove(p)
+    for d in devices.values():
+        if not pin_pool.issuperset(d.pin):
+            missing = set(d.pin) - pin_pool
+            raise PinNotInPinPool(f"pins {missing} were not in pin pool: {pin_pool}.")
+        pin_pool.difference_update(d.pin)
     return pin_pool
 
 
@@ -6,50 +6,72 @@ from .logging import log_record
 _TIMER = Timer()
 _timer_actions: dict[int, object] = {}
 _timer_times: dict[int, int] = {}
+# Snapshot of `_timer_actions.values()`, rebuilt whenever the actions change.
+_timer_callbacks: tuple = ()
+# Running sum of `_timer_times.values()`.
+_timer_total_time: int = 0
 
 PERIOD_BUFFER = const(1500)
 
 
 def _timer_callback(timer: Timer) -> None:
-    for _, v in _timer_actions.items():
+    for v in _timer_callbacks:
         v(timer)  # type: ignore
 
 
 def _total_time() -> int:
-    return sum([i for i in _timer_times.values()])
+    return _timer_total_time
 
 
-def start_timer() -> None:
+def start_timer(silent: bool = False) -> None:
     if len(_timer_actions) > 0:
         period = PERIOD_BUFFER + _total_time()
-        log_record(
-            f"Starting timer with {len(_timer_actions)} action(s)"
-            + f" w/ period: {period}"
-        )
+        if not silent:
+            log_record(
+                f"Starting timer with {len(_timer_actions)} action(s)"
+                + f" w/ period: {period}"
+            )
         _TIMER.init(
             mode=Timer.PERIODIC,
             period=period,
             callback=_timer_callback,
         )
     else:
-        log_record("No timer actions found, skipping start timer")
-        stop_timer()
+        if not silent:
+            log_record("No timer actions found, skipping start timer")
+        stop_timer(silent=silent)
 
 
-def stop_timer() -> None:
-    log_record("Stopping timer")
+def stop_timer(silent: bool = False) -> None:
+    if not silent:
+        log_record("Stopping timer")
     _TIMER.deinit()
 
 
+def _log_requeue(id: int, event: str) -> None:
+    log_record(
+        f"Timer action {id} {event}, {len(_timer_actions)} action(s)"
+        + f" w/ period: {PERIOD_BUFFER + _total_time()}"
+    )
+
+
 def enqueue_to_timer(id: int, callback_time: int, callback) -> None:
     """Add an action to the timer."""
-    stop_timer()
+    global _timer_callbacks, _timer_total_time
+    stop_timer(silent=True)
     _timer_actions[id] = callback
+    _timer_total_time += callback_time - _timer_times.get(id, 0)
     _timer_times[id] = callback_time
-    start_timer()
+    _timer_callbacks = tuple(_timer_actions.values())
+    start_timer(silent=True)
+    _log_requeue(id, "added")
 
 
 def dequeue_from_timer(id: int) -> None:
-    stop_timer()
+    global _timer_callbacks, _timer_total_time
+    stop_timer(silent=True)
     del _timer_actions[id]
-    start_timer()
+    _timer_total_time -= _timer_times.pop(id)
+    _timer_callbacks = tuple(_timer_actions.values())
+    start_timer(silent=True)
+    _log_requeue(id, "removed")
@@ -1,9 +1,9 @@
 """Device classes"""
 
-from collections import deque
+from array import array
 from neopixel import NeoPixel as _NeoPixel
 import time
-import sys
+import micropython
 from machine import Pin, Timer
 from micropython import const
 
@@ -22,6 +22,31 @@ from .lib.picozero import (
     PinsMixin,
 )
 
+# Device classes offered by the app, keyed by class name. For space
+# considerations, only devices requiring 2 pins are registered.
+CLS_MAP: dict[str, type] = {}
+
+
+def _register(cls: type) -> type:
+    """Class decorator adding a device class to `CLS_MAP`."""
+    # Subclasses must change this attribute.
+    if cls.required_pins < 1:
+        raise NotImplementedError(
+            "Overwrite required_pins when extending BinaryDevice."
+        )
+    CLS_MAP[cls.__name__] = cls
+    return cls
+
+
+def _double(cls: type) -> type:
+    """Register a 2 pin variant, named "Double<cls>", of a 1 pin device class.
+
+    Notes:
+        The variant only changes `required_pins`; the extra pin is reserved
+        but otherwise unused.
+    """
+    return _register(type("Double" + cls.__name__, (cls,), {"required_pins": 2}))
+
 
 class BinaryDevice(object):
     # default time to wait between blinking
@@ -36,8 +61,10 @@ class BinaryDevice(object):
 
     # Private attributes
     __pin: tuple[int, ...] = tuple()
-    # Optional[str]
-    __state: str = None  # type: ignore
+    # Built on first use of `pin_string`; the pins never change.
+    __pin_string: str = ""
+    # Optional[str], read directly by `action` and written via `set_state`.
+    _state: str = None  # type: ignore
 
     def __init__(self, pin: tuple[int, ...], verbose: bool = False) -> None:
         """Base class for any device with two states, on_state & off_state.
@@ -55,9 +82,19 @@ class BinaryDevice(object):
             on_state: String representation of the "on" state.
             off_state: String representation of the "off" state.
         """
-        pin = tuple(sorted(pin))  # always sort the pins
+        # Always sort the pins; one and two pins skip the general sort.
+        n = len(pin)
+        if n == 1:
+            pin = (pin[0],)
+        elif n == 2:
+            a, b = pin
+            pin = (a, b) if a <= b else (b, a)
+        else:
+            pin = tuple(sorted(pin))
         self.__pin = pin
         self.verbose = verbose
+        # Reused by `to_json`; only the state changes between calls.
+        self._json = {"pins": pin, "state": None, "name": type(self).__name__}
 
     @property
     def pin(self) -> tuple[int, ...]:
@@ -67,34 +104,22 @@ class BinaryDevice(object):
     def __repr__(self):
         return f"{type(self).__name__} @ Pin : {self.pin}"
 
-    @property
-    def pin_list(self) -> list[int]:
-        """Returns a list of used pin(s) i.e. [2, 4]."""
-        return list(self.__pin)
-
     @property
     def pin_string(self) -> str:
         """Returns a csv seperated string of pin(s) i.e. "2,4"."""
-        return ",".join(str(s) for s in self.__pin)
-
-    @property
-    def get_required_pins(self) -> int:
-        # Subclasses must change this attribute.
-        if self.required_pins == -1:
-            raise NotImplementedError(
-                "Overwrite required_pins when extending BinaryDevice."
-            )
-        return self.required_pins
+        if not self.__pin_string:
+            self.__pin_string = ",".join(str(s) for s in self.__pin)
+        return self.__pin_string
 
     @property
     def state(self) -> str:
         """Returns the active state."""
-        return self.__state
+        return self._state
 
-    @state.setter
-    def state(self, state: str) -> None:
+    def set_state(self, state: str) -> None:
+        """Sets the active state, running the subclass's custom setter first."""
         self.custom_state_setter(state)
-        self.__state = state
+        self._state = state
 
     def custom_state_setter(self, state: str) -> None:
         """Custom action upon setting the state."""
@@ -108,21 +133,22 @@ class BinaryDevice(object):
                 - pin
                 - state
                 - name
+
+        Notes:
+            The same dict is returned on every call, so callers must not
+            modify it.
         """
-        return {
-            const("pins"): self.pin,
-            const("state"): self.state,
-            const("name"): type(self).__name__,
-        }
+        json = self._json
+        json["state"] = self._state
+        return json
 
     def log(self, initial_state: str, action: str, update: str) -> None:
         """Logs update message"""
         if self.verbose:
             print(
-                f"{self}: \n"
-                + f"++++ initial state: {initial_state} \n"
-                + f"++++ action: {action} \n"
-                + f"++++ update: {update}"
+                "{}: \n++++ initial state: {} \n++++ action: {} \n++++ update: {}".format(
+                    self, initial_state, action, update
+                )
             )
 
     def _action(self, action: str) -> str:
@@ -144,12 +170,9 @@ class BinaryDevice(object):
         """
         raise NotImplementedError("Implement this method.")
 
-    def __del__(self) -> None:
-        raise NotImplementedError("Implement this method.")
-
     def close(self) -> None:
         """Close a connection with a switch."""
-        self.__del__()
+        raise NotImplementedError("Implement this method.")
 
 
 class StatefulBinaryDevice(BinaryDevice):
@@ -162,17 +185,19 @@ class StatefulBinaryDevice(BinaryDevice):
         Args:
             action: One of either `self.on_state` or `self.off_state`.
         """
-        if self.state == action:
-            self.log(self.state, action, "skipped")
+        initial_state = self._state
+        if initial_state == action:
+            if self.verbose:
+                self.log(initial_state, action, "skipped")
         else:
-            initial_state = self.state
-            self.state = action
+            self.set_state(action)
             update = self._action(action)
-            self.log(
-                initial_state=initial_state,
-                action=action,
-                update=update,
-            )
+            if self.verbose:
+                self.log(
+                    initial_state=initial_state,
+                    action=action,
+                    update=update,
+                )
 
 
 class StatelessBinaryDevice(BinaryDevice):
@@ -183,13 +208,15 @@ class StatelessBinaryDevice(BinaryDevice):
             action: One of either `self.on_state` or `self.off_state`.
         """
         update = self._action(action)
-        self.log(
-            initial_state=self.state,
-            action=action,
-            update=update,
-        )
+        if self.verbose:
+            self.log(
+                initial_state=self._state,
+                action=action,
+                update=update,
+            )
 
 
+@_register
 class EmptySwitch(StatefulBinaryDevice):
     required_pins = 2
     on_state = None  # type: ignore
@@ -202,7 +229,7 @@ class EmptySwitch(StatefulBinaryDevice):
         """Dummy device to indicate nothing is being used."""
         super(EmptySwitch, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting two pins. Found {self.pin}")
 
     def custom_state_setter(self, state: str) -> None:
@@ -211,7 +238,7 @@ class EmptySwitch(StatefulBinaryDevice):
     def _action(self, action: str) -> str:
         return action
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         pass
 
 
@@ -222,6 +249,13 @@ class ServoTrainSwitch(StatefulBinaryDevice):
 
     _MIN_ANGLE: int = const(0)
     _MAX_ANGLE: int = const(80)
+    # SG90 pulse widths at _MIN_ANGLE and _MAX_ANGLE in a 50Hz frame (us).
+    _FRAME_US: int = const(20000)
+    _MIN_PULSE_US: int = const(400)
+    _MAX_PULSE_US: int = const(2400)
+    # The same bounds as u16 duty cycles, i.e. 2% and 12% of 65535.
+    _MIN_DUTY: int = _MIN_PULSE_US * 65535 // _FRAME_US
+    _MAX_DUTY: int = _MAX_PULSE_US * 65535 // _FRAME_US
     max_angle: int
     min_angle: int
 
@@ -237,7 +271,7 @@ class ServoTrainSwitch(StatefulBinaryDevice):
         """
         super(ServoTrainSwitch, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting {self.required_pins} pins. Found {self.pin}")
         self.min_angle = ServoTrainSwitch._MIN_ANGLE
         self.max_angle = ServoTrainSwitch._MAX_ANGLE
@@ -258,9 +292,12 @@ class ServoTrainSwitch(StatefulBinaryDevice):
             initial_angle=self.initial_angle,
             min_angle=self.min_angle,
             max_angle=self.max_angle,
-            frame_width=1 / 50,  # 1/50Hz corresponds to 20/1000s default
-            min_pulse_width=4 / 10000,  # corresponds to 2% duty cycle
-            max_pulse_width=24 / 10000,  # correponds to 12% duty cycle
+            # 1/50Hz corresponds to 20/1000s default
+            frame_width=ServoTrainSwitch._FRAME_US / 1000000,
+            # corresponds to 2% duty cycle
+            min_pulse_width=ServoTrainSwitch._MIN_PULSE_US / 1000000,
+            # correponds to 12% duty cycle
+            max_pulse_width=ServoTrainSwitch._MAX_PULSE_US / 1000000,
         )
 
     @property
@@ -291,18 +328,29 @@ class ServoTrainSwitch(StatefulBinaryDevice):
 
     def _action(self, action: str) -> str:
         angle = self.action_to_angle(action)
-        self.servo.angle = angle
+        if angle is None:
+            duty = 0
+        elif ServoTrainSwitch._MIN_ANGLE <= angle <= ServoTrainSwitch._MAX_ANGLE:
+            # Same duty AngularServo derives, in integer math.
+            duty = ServoTrainSwitch._MIN_DUTY + int(
+                (ServoTrainSwitch._MAX_DUTY - ServoTrainSwitch._MIN_DUTY)
+                * (angle - ServoTrainSwitch._MIN_ANGLE)
+                // (ServoTrainSwitch._MAX_ANGLE - ServoTrainSwitch._MIN_ANGLE)
+            )
+        else:
+            raise ValueError(
+                "AngularServo angle must be between %s and %s, or None"
+                % (ServoTrainSwitch._MIN_ANGLE, ServoTrainSwitch._MAX_ANGLE)
+            )
+        # Write the PWM slice directly; picozero reads its value back from it.
+        self.servo._pwm.duty_u16(duty)
         return str(angle)
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.servo.close()
 
 
-class DoubleServoTrainSwitch(ServoTrainSwitch):
-    required_pins = 2
-
-    def __init__(self, **kwargs) -> None:
-        super(DoubleServoTrainSwitch, self).__init__(**kwargs)
+DoubleServoTrainSwitch = _double(ServoTrainSwitch)
 
 
 class ContinousServo(Servo):
@@ -338,36 +386,38 @@ class ContinuousServoMotor(StatelessBinaryDevice):
         """
         super(ContinuousServoMotor, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting {self.required_pins} pins. Found {self.pin}")
         self.servo = ContinousServo(pin=self.pin[0])
+        self._servo_on = self.servo.on
 
     def custom_state_setter(self, state: str) -> None:
         pass
 
     def _action(self, action: str) -> str:
         _no_speed: float = 0.5
+        # Run for `t` on picozero's one shot Timer instead of sleeping. Turning
+        # off first cancels the Timer of a run still in flight.
         if action == ContinuousServoMotor.on_state:
-            self.servo.on(speed=_no_speed - self.speed, t=self.t, wait=True)
+            self.servo.off()
+            self._servo_on(speed=_no_speed - self.speed, t=self.t, wait=False)
         elif action == ContinuousServoMotor.off_state:
-            self.servo.on(speed=_no_speed + self.speed, t=self.t, wait=True)
+            self.servo.off()
+            self._servo_on(speed=_no_speed + self.speed, t=self.t, wait=False)
         elif action is None:
             self.servo.off()
         else:
             raise ValueError("Invalid command to servo." + f"\n Found action: {action}")
         return str(action)
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.servo.close()
 
 
-class DoubleContinuousServoMotor(ContinuousServoMotor):
-    required_pins = 2
-
-    def __init__(self, **kwargs) -> None:
-        super(DoubleContinuousServoMotor, self).__init__(**kwargs)
+DoubleContinuousServoMotor = _double(ContinuousServoMotor)
 
 
+@_register
 class DCMotor(StatelessBinaryDevice):
     required_pins = 2
     on_state = "next"
@@ -384,7 +434,7 @@ class DCMotor(StatelessBinaryDevice):
         """
         super(DCMotor, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting {self.required_pins} pins. Found {self.pin}")
 
         self.motor = Motor(forward=self.pin[0], backward=self.pin[1], pwm=True)
@@ -393,17 +443,21 @@ class DCMotor(StatelessBinaryDevice):
         pass
 
     def _action(self, action: str) -> str:
+        # Run for `t` on picozero's one shot Timer instead of sleeping. Turning
+        # off first cancels the Timer of a run still in flight.
         if action == DCMotor.on_state:
-            self.motor.on(speed=1, t=self.t, wait=True)
+            self.motor.off()
+            self.motor.on(speed=1, t=self.t, wait=False)
         elif action == DCMotor.off_state:
-            self.motor.on(speed=-1, t=self.t, wait=True)
+            self.motor.off()
+            self.motor.on(speed=-1, t=self.t, wait=False)
         elif action is None:
             self.motor.off()
         else:
             raise ValueError("Invalid command to motor." + f"\n Found action: {action}")
         return str(action)
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.motor.close()
 
 
@@ -430,14 +484,18 @@ class StepMotor(PinsMixin):
         self._direction = DigitalOutputDevice(pin=direction)
         self._step = DigitalOutputDevice(pin=step)
 
+    @micropython.native
     def on(self, steps: int) -> None:
-        _delay = StepMotor._DELAY
-        _time = time
+        # Drive the step pin directly; `_step` is active high and never
+        # blinks, so picozero's `on` would only add dispatch per edge.
+        pin_value = self._step._pin.value
+        sleep_ms = time.sleep_ms
+        delay = StepMotor._DELAY
         for _ in range(steps):
-            self._step.on(value=1)
-            _time.sleep_ms(_delay)
-            self._step.on(value=0)
-            _time.sleep_ms(_delay)
+            pin_value(1)
+            sleep_ms(delay)
+            pin_value(0)
+            sleep_ms(delay)
 
     def forward(self, steps: int) -> None:
         self._direction.on(value=1)
@@ -456,6 +514,7 @@ class StepMotor(PinsMixin):
         self._step.close()
 
 
+@_register
 class StepperMotor(StatelessBinaryDevice):
     required_pins = 2
     on_state = "next"
@@ -472,7 +531,7 @@ class StepperMotor(StatelessBinaryDevice):
         """
         super(StepperMotor, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting {self.required_pins} pins. Found {self.pin}")
 
         self.motor = StepMotor(direction=self.pin[0], step=self.pin[1])
@@ -501,10 +560,26 @@ class StepperMotor(StatelessBinaryDevice):
             raise ValueError("Invalid command to motor." + f"\n Found action: {action}")
         return str(action)
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.motor.close()
 
 
+@micropython.viper
+def _put_pixel(buf, offset: int, color, bpp: int):
+    """Copy one pixel's `bpp` bytes of `color` into `buf` at `offset`."""
+    dst = ptr8(buf)  # type: ignore
+    src = ptr8(color)  # type: ignore
+    for k in range(bpp):
+        dst[offset + k] = src[k]
+
+
+def _sleep_until(deadline: int) -> None:
+    """Sleep until `deadline` (in `time.ticks_ms` units) if it is still ahead."""
+    remaining = time.ticks_diff(deadline, time.ticks_ms())
+    if remaining > 0:
+        time.sleep_ms(remaining)
+
+
 class LightBeam(StatefulBinaryDevice):
     r: int
     g: int
@@ -536,7 +611,7 @@ class LightBeam(StatefulBinaryDevice):
         """
         super(LightBeam, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting one pin. Found {self.pin}")
 
         self._pin = Pin(self.pin[0], Pin.OUT)
@@ -561,12 +636,22 @@ class LightBeam(StatefulBinaryDevice):
 
         self.reverse_at_end = bool(_reverse_at_end)
         self.pixels = _NeoPixel(pin=self._pin, n=self.n)
+        # `DARK` is all zeros, so clearing is a single copy of this buffer
+        # rather than NeoPixel.fill's per-byte Python loop.
+        self._dark_buf = bytes(len(self.pixels.buf))
+        # The beam color and a dark pixel, laid out once in strip byte order
+        # so a cycle allocates nothing per frame.
+        self._color = (self.r, self.g, self.b)
+        self._lit = self._pixel_bytes(self._color)
+        self._dark = bytes(self.pixels.bpp)
+        # Key of this beam in the shared timer queue.
+        self._timer_key = id(self)
+        # Ring of lit pixel indices reused by every cycle, with room for one
+        # more than the pixels kept lit (at least one, as before).
+        self._ring = array("h", bytes(2 * (max(self.beam_length, 1) + 1)))
 
     def _pixels_clear(self) -> None:
-        self.pixels.fill(self.DARK)
-
-    def _pixel_set(self, i: int, color: tuple[int, ...]) -> None:
-        self.pixels[i] = color
+        self.pixels.buf[:] = self._dark_buf
 
     def _pixel_write(self) -> None:
         self.pixels.write()
@@ -575,103 +660,135 @@ class LightBeam(StatefulBinaryDevice):
         self._pixels_clear()
         self._pixel_write()
 
-    def pixels_cycle(
-        self,
-        color: tuple[int, ...],
-        reverse: bool,
-        measure_time: bool,
-    ) -> int:
-        total_time = 0
-        n = len(self.pixels)
-        queue = deque([], self.beam_length + 1)
-        loop = reversed(range(n)) if reverse else range(n)
-        for i in loop:
-            # Light new pixel
-            queue.append(i)
-            if not measure_time:
-                self._pixel_set(i=i, color=color)
-                self._pixel_write()
-                # `beam_length` lights are on.
-                time.sleep_ms(self.delay)
-            else:
-                total_time += self.delay
+    def _pixel_bytes(self, color: tuple[int, ...]) -> bytearray:
+        """Lay `color` out in the strip's byte order, as NeoPixel would."""
+        order = self.pixels.ORDER
+        out = bytearray(self.pixels.bpp)
+        for k in range(len(out)):
+            out[order[k]] = color[k]
+        return out
+
+    @micropython.native
+    def _pixels_cycle(self, lit: bytearray, reverse: bool) -> None:
+        """Run a beam of `lit` pixels down the strip, or back up if `reverse`."""
+        # Bind everything the loop touches to locals so each frame is a
+        # handful of native calls rather than repeated attribute lookups.
+        pixels = self.pixels
+        write = pixels.write
+        buf = pixels.buf
+        bpp = pixels.bpp
+        put = _put_pixel
+        ticks_add = time.ticks_add
+        sleep_until = _sleep_until
+        # Each frame holds for what used to be two half steps.
+        hold = 2 * self.delay
+        delay = self.delay
+        # Pixels are copied straight into the strip buffer by a viper helper
+        # instead of going through NeoPixel.__setitem__'s per-byte loop.
+        dark = self._dark
+        n = len(pixels)
+        # Fixed ring of lit pixel indices; `head` is the oldest entry and
+        # `count` how many are lit. Avoids a heap allocation per frame.
+        ring = self._ring
+        size = len(ring)
+        keep = size - 1
+        head = 0
+        count = 0
+        # Frames are scheduled against a running deadline so time spent
+        # writing pixels does not stretch the animation.
+        deadline = time.ticks_ms()
+        # Plain `range` loops compile to a counter, so the direction is
+        # applied to the index rather than by allocating `reversed(...)`.
+        last = n - 1
+        for s in range(n):
+            i = last - s if reverse else s
+            # Light the new pixel and drop the oldest in the same frame, so
+            # the strip is sent once per step.
+            ring[(head + count) % size] = i
+            count += 1
+            put(buf, i * bpp, lit, bpp)
             # Enforce beam length
-            if self.beam_length <= len(queue):
-                j = queue.popleft()
-                if not measure_time:
-                    self._pixel_set(i=j, color=self.DARK)
-                    self._pixel_write()
-            if not measure_time:
-                # `beam_length - 1` lights are on.
-                time.sleep_ms(self.delay)
-            else:
-                total_time += self.delay
+            if count > keep:
+                j = ring[head]
+                head = (head + 1) % size
+                count -= 1
+                put(buf, j * bpp, dark, bpp)
+            write()
+            # `beam_length` lights are on.
+            deadline = ticks_add(deadline, hold)
+            sleep_until(deadline)
         # Turn off any remaining pixels.
-        remainder = reversed(queue) if reverse else queue
-        for j in remainder:
-            if not measure_time:
-                self._pixel_set(i=j, color=self.DARK)
-                self._pixel_write()
-                time.sleep_ms(self.delay)
-            else:
-                total_time += self.delay
+        last = count - 1
+        for s in range(count):
+            k = last - s if reverse else s
+            put(buf, ring[(head + k) % size] * bpp, dark, bpp)
+            write()
+            deadline = ticks_add(deadline, delay)
+            sleep_until(deadline)
+
+    def cycle_time(self) -> int:
+        """Time (ms) one `_pixels_cycle` spends sleeping.
+
+        Notes:
+            Each step is held for two delays, then the `beam_length` pixels
+            still lit at the end are cleared one delay apart.
+        """
+        trailing = min(self.n, max(self.beam_length, 1))
+        return (2 * self.n + trailing) * self.delay
+
+    def on_action_time(self) -> int:
+        """Time (ms) one `_on_action` takes, used as the timer budget."""
+        total_time = self.cycle_time()
+        if self.reverse_at_end:
+            total_time *= 2
         return total_time
 
     def custom_state_setter(self, state: str) -> None:
         pass
 
-    def _on_action(self, measure_time: bool) -> int:
-        total_time = 0
-        total_time += self.pixels_cycle(
-            color=(self.r, self.g, self.b),
-            reverse=False,
-            measure_time=measure_time,
-        )
+    def _on_action(self) -> None:
+        # Positional arguments avoid building a kwargs dict per cycle.
+        lit = self._lit
+        self._pixels_cycle(lit, False)
         if self.reverse_at_end:
-            total_time += self.pixels_cycle(
-                color=(self.r, self.g, self.b),
-                reverse=True,
-                measure_time=measure_time,
-            )
-        return total_time
+            self._pixels_cycle(lit, True)
 
     def on_action(self, timer: Timer) -> None:
-        self._on_action(measure_time=False)
+        self._on_action()
 
     def _action(self, action: str) -> str:
         if action == LightBeam.on_state:
             enqueue_to_timer(
-                id=id(self),
-                callback_time=self._on_action(measure_time=True),
+                id=self._timer_key,
+                callback_time=self.on_action_time(),
                 callback=self.on_action,
             )
             return LightBeam.on_state
         elif action == LightBeam.off_state:
-            dequeue_from_timer(id=id(self))
+            dequeue_from_timer(id=self._timer_key)
             self.pixels_reset()
             return LightBeam.off_state
         elif action is None:
-            dequeue_from_timer(id=id(self))
+            dequeue_from_timer(id=self._timer_key)
             self.pixels_reset()
             return
         raise ValueError("Invalid command to NeoPixel." + f"\n Found action: {action}")
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.pixels_reset()
         self._pin = None
 
 
-class DoubleLightBeam(LightBeam):
-    required_pins = 2
-
-    def __init__(self, **kwargs) -> None:
-        super(DoubleLightBeam, self).__init__(**kwargs)
+DoubleLightBeam = _double(LightBeam)
 
 
+@_register
 class RelayTrainSwitch(StatefulBinaryDevice):
     required_pins: int = 2
     on_state: str = "straight"
     off_state: str = "turn"
+    # `_BLINK` in milliseconds, for the one shot timer ending a blink.
+    _BLINK_MS: int = const(100)
 
     def __init__(
         self, active_high: bool = False, initial_value: bool = False, **kwargs
@@ -684,7 +801,7 @@ class RelayTrainSwitch(StatefulBinaryDevice):
         """
         super(RelayTrainSwitch, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting two pins. Found {self.pin}")
 
         _pins: list[int] = list(self.pin)
@@ -697,6 +814,16 @@ class RelayTrainSwitch(StatefulBinaryDevice):
         self.br_relay = DigitalOutputDevice(
             pin=_pins[1], active_high=active_high, initial_value=initial_value
         )
+        # Actions write the relay pins directly. picozero reads its value back
+        # from the pin, so it stays in sync; these are the levels its on() and
+        # off() would write for this `active_high`.
+        self._yg = self.yg_relay._pin.value
+        self._br = self.br_relay._pin.value
+        self._on_level = int(bool(active_high))
+        self._off_level = 1 - self._on_level
+        # One shot timer ending the current blink, and the relay pin it clears.
+        self._blink_timer = None
+        self._blink_pin = None
 
     def custom_state_setter(self, state: str) -> None:
         if state is None:
@@ -708,15 +835,9 @@ class RelayTrainSwitch(StatefulBinaryDevice):
         # otherwise, leave both relays as low - sending no action
         # Now we `BLINK` a single device once for 1/2 second.
         if action == RelayTrainSwitch.off_state:
-            self.br_relay.off()
-            self.br_relay.on()
-            time.sleep(self._BLINK)
-            self.br_relay.off()
+            self._blink(self._br)
         elif action == RelayTrainSwitch.on_state:
-            self.yg_relay.off()
-            self.yg_relay.on()
-            time.sleep(self._BLINK)
-            self.yg_relay.off()
+            self._blink(self._yg)
         elif action is None:
             pass
         else:
@@ -725,7 +846,32 @@ class RelayTrainSwitch(StatefulBinaryDevice):
             )
         return action
 
-    def __del__(self) -> None:
+    def _blink(self, pin_value) -> None:
+        """Pulse a relay pin for `_BLINK` without blocking the caller."""
+        # Finish any blink still in flight so only one pair is ever on.
+        self._end_blink(None)
+        pin_value(self._off_level)
+        pin_value(self._on_level)
+        self._blink_pin = pin_value
+        if self._blink_timer is None:
+            self._blink_timer = Timer()
+        self._blink_timer.init(
+            # period is in milliseconds.
+            period=self._BLINK_MS,
+            mode=Timer.ONE_SHOT,
+            callback=self._end_blink,
+        )
+
+    def _end_blink(self, timer: Timer) -> None:
+        if self._blink_timer is not None:
+            self._blink_timer.deinit()
+        pin_value = self._blink_pin
+        if pin_value is not None:
+            self._blink_pin = None
+            pin_value(self._off_level)
+
+    def close(self) -> None:
+        self._end_blink(None)
         self.yg_relay.close()
         self.br_relay.close()
 
@@ -748,7 +894,7 @@ class OnOff(StatefulBinaryDevice):
         """
         super(OnOff, self).__init__(**kwargs)
 
-        if len(self.pin) != self.get_required_pins:
+        if len(self.pin) != self.required_pins:
             raise ValueError(f"Expecting one pin. Found {self.pin}")
 
         # when active_high=False, on() seems to pass voltage and off() seems to pass no voltage.
@@ -756,6 +902,9 @@ class OnOff(StatefulBinaryDevice):
         self.relay = DigitalOutputDevice(
             pin=self.pin[0], active_high=active_high, initial_value=initial_value
         )
+        # Bound once so each action skips the relay attribute lookups.
+        self._relay_on = self.relay.on
+        self._relay_off = self.relay.off
 
     def custom_state_setter(self, state: str) -> None:
         if not state:
@@ -763,9 +912,9 @@ class OnOff(StatefulBinaryDevice):
 
     def _action(self, action: str) -> str:
         if action == self.off_state:
-            self.relay.off()
+            self._relay_off()
         elif action == self.on_state:
-            self.relay.on()
+            self._relay_on()
         elif action is None:
             pass
         else:
@@ -774,15 +923,11 @@ class OnOff(StatefulBinaryDevice):
             )
         return action
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.relay.close()
 
 
-class DoubleOnOff(OnOff):
-    required_pins = 2
-
-    def __init__(self, **kwargs) -> None:
-        super(DoubleOnOff, self).__init__(**kwargs)
+DoubleOnOff = _double(OnOff)
 
 
 class Disconnect(OnOff):
@@ -796,13 +941,13 @@ class Disconnect(OnOff):
         # If relay is on, turn it off
         if self.relay.value == 1:
             self.relay.off()
-            self.state = self.off_state
+            self.set_state(self.off_state)
         # Now its safe to restart other timer work.
         start_timer()
 
     def _action(self, action: str) -> str:
         if action is None or action == Disconnect.off_state:
-            self.relay.off()
+            self._relay_off()
             # If we had a thread waiting to close, cancel it.
             if self.safe_stop is not None:
                 self.safe_stop.deinit()
@@ -810,7 +955,7 @@ class Disconnect(OnOff):
         elif action == Disconnect.on_state:
             # Give this action priority and temporarily pause all other timers.
             stop_timer()
-            self.relay.on()
+            self._relay_on()
             # Wait for 10 seconds, then turn off.
             self.safe_stop = Timer(
                 # period is in milliseconds.
@@ -824,18 +969,14 @@ class Disconnect(OnOff):
             )
         return action
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self.relay.off()
         if self.safe_stop is not None:
             self.safe_stop.deinit()
-        super().__del__()
-
+        super().close()
 
-class DoubleDisconnect(Disconnect):
-    required_pins = 2
 
-    def __init__(self, **kwargs) -> None:
-        super(DoubleDisconnect, self).__init__(**kwargs)
+DoubleDisconnect = _double(Disconnect)
 
 
 class Unloader(OnOff):
@@ -845,11 +986,7 @@ class Unloader(OnOff):
         super(Unloader, self).__init__(active_high=False, **kwargs)
 
 
-class DoubleUnloader(Unloader):
-    required_pins = 2
-
-    def __init__(self, **kwargs) -> None:
-        super(DoubleUnloader, self).__init__(**kwargs)
+DoubleUnloader = _double(Unloader)
 
 
 class InvertedDisconnect(Disconnect):
@@ -886,6 +1023,7 @@ class InvertedSingleRelayTrainSwitch(SingleRelayTrainSwitch):
         super(InvertedSingleRelayTrainSwitch, self).__init__(active_high=True, **kwargs)
 
 
+@_register
 class SpurTrainSwitch(RelayTrainSwitch):
     """Extension of Relay Switch that will optionally depower the track."""
 
@@ -895,11 +1033,11 @@ class SpurTrainSwitch(RelayTrainSwitch):
     def _action(self, action: str) -> str:
         # leave the pins on in an alternating fashion
         if action == SpurTrainSwitch.off_state:
-            self.yg_relay.off()
-            self.br_relay.on()
+            self._yg(self._off_level)
+            self._br(self._on_level)
         elif action == SpurTrainSwitch.on_state:
-            self.br_relay.off()
-            self.yg_relay.on()
+            self._br(self._off_level)
+            self._yg(self._on_level)
         elif action is None:
             pass
         else:
@@ -909,6 +1047,7 @@ class SpurTrainSwitch(RelayTrainSwitch):
         return action
 
 
+@_register
 class InvertedSpurTrainSwitch(SpurTrainSwitch):
     """Extension of Spur Train Switch but with inverted active_high."""
 
@@ -916,6 +1055,7 @@ class InvertedSpurTrainSwitch(SpurTrainSwitch):
         super(InvertedSpurTrainSwitch, self).__init__(active_high=True, **kwargs)
 
 
+@_register
 class InvertedRelayTrainSwitch(RelayTrainSwitch):
     """Extension of Relay Train Switch but with inverted active_high."""
 
@@ -923,11 +1063,4 @@ class InvertedRelayTrainSwitch(RelayTrainSwitch):
         super(InvertedRelayTrainSwitch, self).__init__(active_high=True, **kwargs)
 
 
-CLS_MAP: dict[str, type[BinaryDevice]] = {
-    k: v
-    for k, v in sys.modules[__name__].__dict__.items()
-    # For space considerations, only offer devices requiring 2 pins.
-    if hasattr(v, "required_pins") and v.required_pins == 2
-}
-
 DEFAULT_DEVICE: str = const(RelayTrainSwitch.__name__)